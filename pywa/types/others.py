@@ -161,7 +161,7 @@ class Location(utils.FromDict):
     @property
     def current_location(self) -> bool:
         """Check if the shared location is the current location or manually selected."""
-        return not any((self.name, self.address, self.url))
+        return not (self.name or self.address or self.url)
 
     def in_radius(self, lat: float, lon: float, radius: float | int) -> bool:
         """
@@ -13,11 +13,13 @@ __all__ = [
 
 import abc
 import dataclasses
+import functools
 import logging
 import re
+import sys
 import pathlib
 import datetime
-from typing import TYPE_CHECKING, Any, BinaryIO, Iterable, Literal
+from typing import TYPE_CHECKING, Any, BinaryIO, ClassVar, Iterable, Literal
 
 from .. import utils
 
@@ -30,13 +32,27 @@ if TYPE_CHECKING:
 
 _logger = logging.getLogger(__name__)
 
+_DEFAULT_PLACEHOLDER = ("{", "}")
 
+# the {{n}} tokens templates may actually use, prebuilt (WhatsApp allows far
+# fewer placeholders per component than this)
+_PLACEHOLDER_TOKENS = tuple("{{%d}}" % i for i in range(1, 21))
+
+_PLACEHOLDER_RE_CACHE: dict[tuple[str, str], re.Pattern] = {
+    ("{", "}"): re.compile(r"\{(.*?)\}")  # pre-populated for the default pair
+}
+
+
+@functools.lru_cache(maxsize=256)
 def _get_examples_from_placeholders(
     string: str, start: str = "{", end: str = "}"
 ) -> tuple[str, tuple[str, ...]]:
     """
     Extracts the examples from a string.
 
+    The result is memoized, so components that serialize the same text
+    repeatedly (e.g. bulk template submission) parse it only once.
+
     Example:
 
         >>> _get_examples_from_placeholders('Hello, {john}, today is {day}')
@@ -51,12 +67,26 @@ def _get_examples_from_placeholders(
     Returns:
       A tuple of the formatted string and the examples.
     """
+    if start not in string:  # the common case: no placeholders at all
+        return string, ()
+    pattern = _PLACEHOLDER_RE_CACHE.get((start, end))
+    if pattern is None:
+        pattern = _PLACEHOLDER_RE_CACHE[(start, end)] = re.compile(
+            re.escape(start) + "(.*?)" + re.escape(end)
+        )
     examples: list[str] = []
-    for example in re.finditer(r"\%s(.*?)\%s" % (start, end), string):
-        examples.append(example.group(1))
-    for idx, example in enumerate(examples, start=1):
-        string = string.replace(f"{start}{example}{end}", "{{" + str(idx) + "}}")
-    return string, tuple(examples)
+
+    def repl(match: re.Match) -> str:
+        examples.append(match.group(1))
+        n = len(examples)
+        return _PLACEHOLDER_TOKENS[n - 1] if n <= 20 else "{{%d}}" % n
+
+    return pattern.sub(repl, string), tuple(examples)
+
+
+def _serialize(parts: Iterable) -> list[dict[str, Any]]:
+    """Serialize an iterable of components into a list of payload dicts."""
+    return [part.to_dict() for part in parts]
 
 
 @dataclasses.dataclass(frozen=True, slots=True)
@@ -81,6 +111,20 @@ class ComponentType(utils.StrEnum):
     BUTTONS = "BUTTONS"
 
 
+# the enum ``.value`` lookups go through the descriptor protocol on every
+# serialization, so the hot ``to_dict`` paths use these plain-str constants
+_CT_HEADER, _CT_BODY, _CT_FOOTER, _CT_BUTTONS = (
+    sys.intern(c.value) for c in ComponentType
+)
+
+# the BODY component of an AUTHENTICATION template has exactly two possible
+# shapes, so both are prebuilt; copied on use so callers get a private dict
+_AUTH_BODY_COMPONENTS = {
+    True: {"type": _CT_BODY, "add_security_recommendation": True},
+    False: {"type": _CT_BODY, "add_security_recommendation": False},
+}
+
+
 class HeaderFormatType(utils.StrEnum):
     TEXT = "TEXT"
     IMAGE = "IMAGE"
@@ -89,6 +133,11 @@ class HeaderFormatType(utils.StrEnum):
     LOCATION = "LOCATION"
 
 
+_HF_TEXT, _HF_IMAGE, _HF_VIDEO, _HF_DOCUMENT, _HF_LOCATION = (
+    sys.intern(f.value) for f in HeaderFormatType
+)
+
+
 class ButtonType(utils.StrEnum):
     PHONE_NUMBER = "PHONE_NUMBER"
     URL = "URL"
@@ -100,6 +149,24 @@ class ButtonType(utils.StrEnum):
     FLOW = "FLOW"
 
 
+(
+    _BT_PHONE_NUMBER,
+    _BT_URL,
+    _BT_QUICK_REPLY,
+    _BT_OTP,
+    _BT_MPM,
+    _BT_CATALOG,
+    _BT_COPY_CODE,
+    _BT_FLOW,
+) = (sys.intern(b.value) for b in ButtonType)
+
+# payloads that never vary per instance, prebuilt once; .copy() hands each
+# caller a private dict
+_LOCATION_HEADER_PAYLOAD = {"type": _CT_HEADER, "format": _HF_LOCATION}
+_MPM_BUTTON_PAYLOAD = {"type": _BT_MPM, "text": "View items"}
+_CATALOG_BUTTON_PAYLOAD = {"type": _BT_CATALOG, "text": "View catalog"}
+
+
 class Language(utils.StrEnum):
     """
     Template language and locale code.
@@ -280,68 +347,93 @@ class NewTemplate:
     header: Text | Image | Video | Document | Location | None = None
     footer: Footer | None = None
     buttons: (
-        Iterable[PhoneNumberButton | UrlButton | QuickReplyButton | CopyCodeButton]
+        tuple[PhoneNumberButton | UrlButton | QuickReplyButton | CopyCodeButton, ...]
         | MPMButton
         | CatalogButton
         | OTPButton
         | FlowButton
         | None
     ) = None
+    _otp_buttons: bool = dataclasses.field(
+        default=False, init=False, repr=False, compare=False
+    )
 
     def __post_init__(self):
-        if self.category == self.Category.AUTHENTICATION and not (
-            isinstance(self.body, self.AuthBody)
-            or isinstance(self.buttons, self.OTPButton)
+        # normalize enum members to their plain-str values up front so the
+        # serialization path never goes through the StrEnum descriptors
+        self.category = str(self.category)
+        self.language = str(self.language)
+        self._otp_buttons = isinstance(self.buttons, self.OTPButton)
+        if self.category == "AUTHENTICATION" and not (  # Category.AUTHENTICATION
+            isinstance(self.body, self.AuthBody) or self._otp_buttons
         ):
             raise ValueError(
                 "body of AuthBody and buttons of OTPButton are required for AUTHENTICATION"
             )
+        if isinstance(self.buttons, Iterable):
+            # materialize once so repeated to_dict calls don't re-consume
+            # (and possibly exhaust) a caller-supplied iterable
+            self.buttons = tuple(self.buttons)
 
     def to_dict(self, placeholder: tuple[str, str] = None) -> dict[str, Any]:
-        if isinstance(self.buttons, self.OTPButton):
-            components = (
-                dict(
-                    type=ComponentType.BUTTONS.value,
-                    buttons=(self.buttons.to_dict(),),
-                ),
-                dict(
-                    type=ComponentType.BODY.value,
-                    add_security_recommendation=self.body.add_security_recommendation,
-                ),
-                dict(
-                    type=ComponentType.FOOTER.value,
-                    code_expiration_minutes=self.body.code_expiration_minutes,
-                )
-                if self.body.code_expiration_minutes
-                else None,
+        components: list[dict[str, Any]] = []
+        if self._otp_buttons:
+            components.append(
+                {
+                    "type": _CT_BUTTONS,
+                    "buttons": [self.buttons.to_dict()],
+                }
+            )
+            components.append(
+                _AUTH_BODY_COMPONENTS[self.body.add_security_recommendation].copy()
             )
+            if self.body.code_expiration_minutes:
+                components.append(
+                    {
+                        "type": _CT_FOOTER,
+                        "code_expiration_minutes": self.body.code_expiration_minutes,
+                    }
+                )
         else:
-            components = (
-                self.body.to_dict(placeholder),
-                self.header.to_dict(placeholder) if self.header else None,
-                self.footer.to_dict() if self.footer else None,
-                dict(
-                    type=ComponentType.BUTTONS.value,
-                    buttons=tuple(
-                        button.to_dict(placeholder)
-                        for button in (
-                            self.buttons
-                            if isinstance(self.buttons, Iterable)
-                            else (self.buttons,)
-                        )
-                    ),
+            components.append(self.body.to_dict(placeholder))
+            if self.header:
+                components.append(self.header.to_dict(placeholder))
+            if self.footer:
+                components.append(self.footer.to_dict())
+            if self.buttons:
+                buttons = (
+                    self.buttons
+                    if isinstance(self.buttons, Iterable)
+                    else (self.buttons,)
                 )
-                if self.buttons
-                else None,
-            )
-        return dict(
-            name=self.name,
-            category=self.category.value,
-            language=str(self.language),
-            components=tuple(
-                component for component in components if component is not None
-            ),
-        )
+                components.append(
+                    {
+                        "type": _CT_BUTTONS,
+                        "buttons": [button.to_dict(placeholder) for button in buttons],
+                    }
+                )
+        return {
+            "name": self.name,
+            "category": self.category,
+            "language": self.language,
+            "components": components,
+        }
+
+    @staticmethod
+    def to_dicts(
+        templates: Iterable[NewTemplate], placeholder: tuple[str, str] = None
+    ) -> tuple[dict[str, Any], ...]:
+        """
+        Serialize multiple templates at once (e.g. for bulk submission).
+
+        Args:
+            templates: The templates to serialize.
+            placeholder: The placeholder pair to use for all the templates (optional).
+
+        Returns:
+            A tuple of the serialized templates.
+        """
+        return tuple(template.to_dict(placeholder) for template in templates)
 
     Language = Language
 
@@ -363,7 +455,7 @@ class NewTemplate:
         MARKETING = "MARKETING"
         UTILITY = "UTILITY"
 
-    @dataclasses.dataclass(slots=True)
+    @dataclasses.dataclass(slots=True, frozen=True)
     class Text(NewTemplateHeaderABC):
         """
         Represents a text header.
@@ -377,27 +469,37 @@ class NewTemplate:
             text: Text to send with the header (Up to 60 characters. Supports 1 placeholder).
         """
 
-        type: ComponentType = dataclasses.field(
-            default=ComponentType.HEADER, init=False, repr=False
-        )
-        format: HeaderFormatType = dataclasses.field(
-            default=HeaderFormatType.TEXT, init=False, repr=False
-        )
+        type: ClassVar[str] = _CT_HEADER
+        format: ClassVar[str] = _HF_TEXT
         text: str
 
         def to_dict(self, placeholder: tuple[str, str] = None) -> dict[str, str | None]:
+            start, end = placeholder or _DEFAULT_PLACEHOLDER
+            if start not in self.text:
+                return {"type": _CT_HEADER, "format": _HF_TEXT, "text": self.text}
             formatted_text, examples = _get_examples_from_placeholders(
-                self.text, *(placeholder if placeholder else ())
-            )
-            return dict(
-                type=self.type.value,
-                format=self.format.value,
-                text=formatted_text,
-                **(dict(example=dict(header_text=examples)) if examples else {}),
+                self.text, start, end
             )
+            d = {"type": _CT_HEADER, "format": _HF_TEXT, "text": formatted_text}
+            if examples:
+                d["example"] = {"header_text": list(examples)}
+            return d
 
-    @dataclasses.dataclass(slots=True)
-    class Image(NewTemplateHeaderABC):
+    @dataclasses.dataclass(slots=True, frozen=True)
+    class _MediaHeader(NewTemplateHeaderABC):
+        """Base for the handle-based media headers (image, video, document)."""
+
+        example: str
+
+        def to_dict(self, placeholder: None = None) -> dict[str, Any]:
+            return {
+                "type": _CT_HEADER,
+                "format": self.format,
+                "example": {"header_handle": [self.example]},
+            }
+
+    @dataclasses.dataclass(slots=True, frozen=True)
+    class Image(_MediaHeader):
         """
         Represents an image header.
 
@@ -410,23 +512,11 @@ class NewTemplate:
              <https://developers.facebook.com/docs/graph-api/guides/upload>`_ to upload the image)
         """
 
-        type: ComponentType = dataclasses.field(
-            default=ComponentType.HEADER, init=False, repr=False
-        )
-        format: HeaderFormatType = dataclasses.field(
-            default=HeaderFormatType.IMAGE, init=False, repr=False
-        )
-        example: str
-
-        def to_dict(self) -> dict[str, Any]:
-            return dict(
-                type=self.type.value,
-                format=self.format.value,
-                example=dict(header_handle=(self.example,)),
-            )
+        type: ClassVar[str] = _CT_HEADER
+        format: ClassVar[str] = _HF_IMAGE
 
-    @dataclasses.dataclass(slots=True)
-    class Video(NewTemplateHeaderABC):
+    @dataclasses.dataclass(slots=True, frozen=True)
+    class Video(_MediaHeader):
         """
         Represents a video header.
 
@@ -439,23 +529,11 @@ class NewTemplate:
              <https://developers.facebook.com/docs/graph-api/guides/upload>`_ to upload the video)
         """
 
-        type: ComponentType = dataclasses.field(
-            default=ComponentType.HEADER, init=False, repr=False
-        )
-        format: HeaderFormatType = dataclasses.field(
-            default=HeaderFormatType.VIDEO, init=False, repr=False
-        )
-        example: str
-
-        def to_dict(self) -> dict[str, Any]:
-            return dict(
-                type=self.type.value,
-                format=self.format.value,
-                example=dict(header_handle=(self.example,)),
-            )
+        type: ClassVar[str] = _CT_HEADER
+        format: ClassVar[str] = _HF_VIDEO
 
-    @dataclasses.dataclass(slots=True)
-    class Document(NewTemplateHeaderABC):
+    @dataclasses.dataclass(slots=True, frozen=True)
+    class Document(_MediaHeader):
         """
         Represents a document header.
 
@@ -468,22 +546,10 @@ class NewTemplate:
              <https://developers.facebook.com/docs/graph-api/guides/upload>`_ to upload the document)
         """
 
-        type: ComponentType = dataclasses.field(
-            default=ComponentType.HEADER, init=False, repr=False
-        )
-        format: HeaderFormatType = dataclasses.field(
-            default=HeaderFormatType.DOCUMENT, init=False, repr=False
-        )
-        example: str
+        type: ClassVar[str] = _CT_HEADER
+        format: ClassVar[str] = _HF_DOCUMENT
 
-        def to_dict(self) -> dict[str, Any]:
-            return dict(
-                type=self.type.value,
-                format=self.format.value,
-                example=dict(header_handle=(self.example,)),
-            )
-
-    @dataclasses.dataclass(slots=True)
+    @dataclasses.dataclass(slots=True, frozen=True)
     class Location(NewTemplateHeaderABC):
         """
         Location headers appear as generic maps at the top of the template and are useful for order tracking, delivery
@@ -497,20 +563,13 @@ class NewTemplate:
             >>> NewTemplate.Location()
         """
 
-        type: ComponentType = dataclasses.field(
-            default=ComponentType.HEADER, init=False, repr=False
-        )
-        format: HeaderFormatType = dataclasses.field(
-            default=HeaderFormatType.LOCATION, init=False, repr=False
-        )
+        type: ClassVar[str] = _CT_HEADER
+        format: ClassVar[str] = _HF_LOCATION
 
-        def to_dict(self) -> dict[str, str]:
-            return dict(
-                type=self.type.value,
-                format=self.format.value,
-            )
+        def to_dict(self, placeholder: None = None) -> dict[str, str]:
+            return _LOCATION_HEADER_PAYLOAD.copy()
 
-    @dataclasses.dataclass(slots=True)
+    @dataclasses.dataclass(slots=True, frozen=True)
     class Body(NewTemplateComponentABC):
         """
         Represents a template body.
@@ -527,22 +586,22 @@ class NewTemplate:
             text: Text to send with the body (Up to 1024 characters. Supports multiple placeholders).
         """
 
-        type: ComponentType = dataclasses.field(
-            default=ComponentType.BODY, init=False, repr=False
-        )
+        type: ClassVar[str] = _CT_BODY
         text: str
 
         def to_dict(self, placeholder: tuple[str, str] = None) -> dict[str, str | None]:
+            start, end = placeholder or _DEFAULT_PLACEHOLDER
+            if start not in self.text:
+                return {"type": _CT_BODY, "text": self.text}
             formatted_text, examples = _get_examples_from_placeholders(
-                self.text, *(placeholder if placeholder else ())
-            )
-            return dict(
-                type=self.type.value,
-                text=formatted_text,
-                **(dict(example=dict(body_text=(examples,))) if examples else {}),
+                self.text, start, end
             )
+            d = {"type": _CT_BODY, "text": formatted_text}
+            if examples:
+                d["example"] = {"body_text": [list(examples)]}
+            return d
 
-    @dataclasses.dataclass(slots=True)
+    @dataclasses.dataclass(slots=True, frozen=True)
     class AuthBody:
         """
         Represents the configuration for an authentication template.
@@ -565,7 +624,7 @@ class NewTemplate:
         code_expiration_minutes: int | None = None
         add_security_recommendation: bool = False
 
-    @dataclasses.dataclass(slots=True)
+    @dataclasses.dataclass(slots=True, frozen=True)
     class Footer(NewTemplateComponentABC):
         """
         Represents a template footer.
@@ -578,15 +637,13 @@ class NewTemplate:
             text: Text to send with the footer (Up to 60 characters, no placeholders allowed).
         """
 
-        type: ComponentType = dataclasses.field(
-            default=ComponentType.FOOTER, init=False, repr=False
-        )
+        type: ClassVar[str] = _CT_FOOTER
         text: str
 
         def to_dict(self) -> dict[str, str | None]:
-            return dict(type=self.type.value, text=self.text)
+            return {"type": _CT_FOOTER, "text": self.text}
 
-    @dataclasses.dataclass(slots=True)
+    @dataclasses.dataclass(slots=True, frozen=True)
     class PhoneNumberButton(NewButtonABC):
         """
         Phone number buttons call the specified business phone number when tapped by the app user.
@@ -604,20 +661,18 @@ class NewTemplate:
              called when the user taps the button (Up to 20 characters, no placeholders allowed).
         """
 
-        type: ButtonType = dataclasses.field(
-            default=ButtonType.PHONE_NUMBER, init=False, repr=False
-        )
+        type: ClassVar[str] = _BT_PHONE_NUMBER
         title: str
         phone_number: int | str
 
         def to_dict(self, placeholder: None = None) -> dict[str, str]:
-            return dict(
-                type=self.type.value,
-                text=self.title,
-                phone_number=str(self.phone_number),
-            )
+            return {
+                "type": _BT_PHONE_NUMBER,
+                "text": self.title,
+                "phone_number": str(self.phone_number),
+            }
 
-    @dataclasses.dataclass(slots=True)
+    @dataclasses.dataclass(slots=True, frozen=True)
     class UrlButton(NewButtonABC):
         """
         URL buttons load the specified URL in the device's default web browser when tapped by the app user.
@@ -636,34 +691,36 @@ class NewTemplate:
              be appended to the end of the URL).
         """
 
-        type: ComponentType = dataclasses.field(
-            default=ButtonType.URL, init=False, repr=False
-        )
+        type: ClassVar[str] = _BT_URL
         title: str
         url: str
 
         def to_dict(self, placeholder: tuple[str, str] = None) -> dict[str, str]:
+            start, end = placeholder or _DEFAULT_PLACEHOLDER
+            if start not in self.title + self.url:
+                return {
+                    "type": _BT_URL,
+                    "text": self.title,
+                    "url": self.url,
+                    "example": {},
+                }
             (
                 formatted_title,
                 title_examples,
-            ) = _get_examples_from_placeholders(
-                self.title, *(placeholder if placeholder else ())
-            )
+            ) = _get_examples_from_placeholders(self.title, start, end)
             (
                 formatted_url,
                 url_examples,
-            ) = _get_examples_from_placeholders(
-                self.url, *(placeholder if placeholder else ())
-            )
+            ) = _get_examples_from_placeholders(self.url, start, end)
             examples = title_examples + url_examples
-            return dict(
-                type=self.type.value,
-                text=formatted_title,
-                url=formatted_url,
-                **(dict(example=examples if examples else {})),
-            )
-
-    @dataclasses.dataclass(slots=True)
+            return {
+                "type": _BT_URL,
+                "text": formatted_title,
+                "url": formatted_url,
+                "example": list(examples) if examples else {},
+            }
+
+    @dataclasses.dataclass(slots=True, frozen=True)
     class QuickReplyButton(NewButtonABC):
         """
         Quick reply buttons are custom text-only buttons that immediately message you with the specified text string when
@@ -686,15 +743,13 @@ class NewTemplate:
             text: The text to send when the user taps the button (Up to 25 characters, no placeholders allowed).
         """
 
-        type: ComponentType = dataclasses.field(
-            default=ButtonType.QUICK_REPLY, init=False, repr=False
-        )
+        type: ClassVar[str] = _BT_QUICK_REPLY
         text: str
 
         def to_dict(self, placeholder: None = None) -> dict[str, str]:
-            return dict(type=self.type.value, text=self.text)
+            return {"type": _BT_QUICK_REPLY, "text": self.text}
 
-    @dataclasses.dataclass(slots=True)
+    @dataclasses.dataclass(slots=True, frozen=True)
     class OTPButton(NewButtonABC):
         """
         Represents a button that can be used to send an OTP.
@@ -735,9 +790,7 @@ class NewTemplate:
              ``OtpType.ZERO_TAP``. Defaults to ``True``.
         """
 
-        type: ComponentType = dataclasses.field(
-            default=ButtonType.OTP, init=False, repr=False
-        )
+        type: ClassVar[str] = _BT_OTP
         otp_type: OtpType
         title: str | None = None
         autofill_text: str | None = None
@@ -760,6 +813,7 @@ class NewTemplate:
             ZERO_TAP = "ZERO_TAP"
 
         def __post_init__(self):
+            object.__setattr__(self, "otp_type", str(self.otp_type))
             if self.otp_type in (self.OtpType.ONE_TAP, self.OtpType.ZERO_TAP) and not (
                 self.package_name and self.signature_hash
             ):
@@ -768,29 +822,21 @@ class NewTemplate:
                 )
 
         def to_dict(self, placeholder: None = None) -> dict[str, str | None]:
-            base = dict(
-                type=self.type.value,
-                otp_type=self.otp_type.value,
-                text=self.title,
-            )
+            base = {
+                "type": _BT_OTP,
+                "otp_type": self.otp_type,
+                "text": self.title,
+            }
             if self.otp_type in (self.OtpType.ONE_TAP, self.OtpType.ZERO_TAP):
-                base.update(
-                    package_name=self.package_name,
-                    signature_hash=self.signature_hash,
-                    **(
-                        dict(autofill_text=self.autofill_text)
-                        if self.autofill_text
-                        else {}
-                    ),
-                    **(
-                        dict(zero_tap_terms_accepted=self.zero_tap_terms_accepted)
-                        if self.otp_type == self.OtpType.ZERO_TAP
-                        else {}
-                    ),
-                )
+                base["package_name"] = self.package_name
+                base["signature_hash"] = self.signature_hash
+                if self.autofill_text:
+                    base["autofill_text"] = self.autofill_text
+                if self.otp_type == self.OtpType.ZERO_TAP:
+                    base["zero_tap_terms_accepted"] = self.zero_tap_terms_accepted
             return base
 
-    @dataclasses.dataclass(slots=True)
+    @dataclasses.dataclass(slots=True, frozen=True)
     class MPMButton(NewButtonABC):
         """
         Represents a button that can be used to send multi-product message (MPM)
@@ -801,16 +847,12 @@ class NewTemplate:
             >>> NewTemplate.MPMButton()
         """
 
-        type: ComponentType = dataclasses.field(
-            default=ButtonType.MPM, init=False, repr=False
-        )
+        type: ClassVar[str] = _BT_MPM
 
         def to_dict(self, placeholder: None = None) -> dict[str, str]:
-            return dict(
-                type=self.type.value, text="View items"
-            )  # required text for MPM button
+            return _MPM_BUTTON_PAYLOAD.copy()  # required text for MPM button
 
-    @dataclasses.dataclass(slots=True)
+    @dataclasses.dataclass(slots=True, frozen=True)
     class CatalogButton(NewButtonABC):
         """
         Represent a button that can be used to display a catalog.
@@ -821,16 +863,12 @@ class NewTemplate:
 
         """
 
-        type: ComponentType = dataclasses.field(
-            default=ButtonType.CATALOG, init=False, repr=False
-        )
+        type: ClassVar[str] = _BT_CATALOG
 
         def to_dict(self, placeholder: None = None) -> dict[str, str]:
-            return dict(
-                type=self.type.value, text="View catalog"
-            )  # required text for catalog button
+            return _CATALOG_BUTTON_PAYLOAD.copy()  # required text for catalog button
 
-    @dataclasses.dataclass(slots=True)
+    @dataclasses.dataclass(slots=True, frozen=True)
     class CopyCodeButton(NewButtonABC):
         """
         Represents a button that can be used to copy coupon codes to the user's clipboard.
@@ -846,15 +884,13 @@ class NewTemplate:
             example: An example of the coupon code (Up to 15 characters).
         """
 
-        type: ComponentType = dataclasses.field(
-            default=ButtonType.COPY_CODE, init=False, repr=False
-        )
+        type: ClassVar[str] = _BT_COPY_CODE
         example: str
 
         def to_dict(self, placeholder: tuple[str, str] = None) -> dict[str, str | None]:
-            return dict(type=self.type.value, example=self.example)
+            return {"type": _BT_COPY_CODE, "example": self.example}
 
-    @dataclasses.dataclass(slots=True)
+    @dataclasses.dataclass(slots=True, frozen=True)
     class FlowButton(NewButtonABC):
         """
         Represents a button that can be used to send a message with a flow.
@@ -875,30 +911,27 @@ class NewTemplate:
             navigate_screen: The screen to navigate to (required if ``flow_action`` is ``NAVIGATE``).
         """
 
-        type: ButtonType = dataclasses.field(
-            default=ButtonType.QUICK_REPLY, init=False, repr=False
-        )
+        type: ClassVar[str] = _BT_QUICK_REPLY
         title: str
         flow_id: str | int
         flow_action: Literal[FlowActionType.NAVIGATE, FlowActionType.DATA_EXCHANGE]
         navigate_screen: str | None = None
 
         def __post_init__(self):
+            object.__setattr__(self, "flow_action", str(self.flow_action))
             if self.flow_action == FlowActionType.NAVIGATE and not self.navigate_screen:
                 raise ValueError("`navigate_screen` is required for FLOW with NAVIGATE")
 
         def to_dict(self, placeholder: None = None) -> dict[str, str]:
-            return dict(
-                type=self.type.value,
-                text=self.title,
-                flow_id=str(self.flow_id),
-                flow_action=self.flow_action,
-                **(
-                    {"navigate_screen": self.navigate_screen}
-                    if self.navigate_screen
-                    else {}
-                ),
-            )
+            d = {
+                "type": _BT_QUICK_REPLY,
+                "text": self.title,
+                "flow_id": str(self.flow_id),
+                "flow_action": self.flow_action,
+            }
+            if self.navigate_screen:
+                d["navigate_screen"] = self.navigate_screen
+            return d
 
 
 class ParamType(utils.StrEnum):
@@ -912,7 +945,21 @@ class ParamType(utils.StrEnum):
     BUTTON = "button"
 
 
+(
+    _PT_TEXT,
+    _PT_CURRENCY,
+    _PT_DATE_TIME,
+    _PT_DOCUMENT,
+    _PT_IMAGE,
+    _PT_VIDEO,
+    _PT_LOCATION,
+    _PT_BUTTON,
+) = (sys.intern(p.value) for p in ParamType)
+
+
 class ComponentABC(abc.ABC):
+    # kept for backwards compatibility; the parameter dataclasses no longer
+    # inherit from it so their MRO (and every attribute lookup) stays short
     @property
     @abc.abstractmethod
     def type(self) -> ParamType: ...
@@ -966,10 +1013,10 @@ class Template:
 
     name: str
     language: Language | str
-    body: Iterable[TextValue | Currency | DateTime] | None = None
+    body: tuple[TextValue | Currency | DateTime, ...] | None = None
     header: TextValue | Document | Image | Video | Location | None = None
     buttons: (
-        Iterable[QuickReplyButtonData | UrlButtonValue]
+        tuple[QuickReplyButtonData | UrlButtonValue, ...]
         | OTPButtonCode
         | MPMButton
         | CatalogButton
@@ -979,61 +1026,63 @@ class Template:
     ) = None
 
     def __post_init__(self):
+        self.language = str(self.language)
         if isinstance(self.buttons, self.OTPButtonCode):
             self.body = (
                 self.TextValue(value=self.buttons.code),
             )  # auth template required the code also in the body
+            return
+        if self.body is not None and not isinstance(self.body, tuple):
+            self.body = tuple(self.body)
+        if isinstance(self.buttons, Iterable):
+            self.buttons = tuple(self.buttons)
 
     def to_dict(self, is_header_url: bool = False) -> dict[str, Any]:
-        return dict(
-            name=self.name,
-            language=dict(code=str(self.language)),
-            components=tuple(
-                comp
-                for comp in (
-                    dict(
-                        type=ComponentType.BODY.value,
-                        parameters=tuple(
-                            component.to_dict() for component in self.body
-                        ),
-                    )
-                    if self.body
-                    else None,
-                    dict(
-                        type=ComponentType.HEADER.value,
-                        parameters=(self.header.to_dict(is_header_url),),
-                    )
-                    if self.header
-                    else None,
-                    *(
-                        (
-                            dict(
-                                type=b.type.value,
-                                sub_type=b.sub_type.value,
-                                index=idx,
-                                parameters=(b.to_dict(),),
-                            )
-                            for idx, b in enumerate(
-                                self.buttons
-                                if isinstance(self.buttons, Iterable)
-                                else (self.buttons,)  # case of OTPButtonCode
-                            )
-                        )
-                        if self.buttons is not None
-                        else ()
-                    ),
+        components: list[dict[str, Any]] = []
+        if self.body:
+            components.append(
+                {
+                    "type": _CT_BODY,
+                    "parameters": _serialize(self.body),
+                }
+            )
+        if self.header:
+            components.append(
+                {
+                    "type": _CT_HEADER,
+                    "parameters": [self.header.to_dict(is_header_url)],
+                }
+            )
+        if self.buttons is not None:
+            for idx, button in enumerate(
+                self.buttons
+                if isinstance(self.buttons, Iterable)
+                else (self.buttons,)  # case of OTPButtonCode
+            ):
+                components.append(
+                    {
+                        "type": button.type,
+                        "sub_type": button.sub_type,
+                        "index": idx,
+                        "parameters": [button.to_dict()],
+                    }
                 )
-                if comp is not None
-            ),
-        )
+        return {
+            "name": self.name,
+            "language": {"code": self.language},
+            "components": components,
+        }
 
     Language = Language
 
-    @dataclasses.dataclass(slots=True)
-    class TextValue(ComponentABC):
+    class TextValue:
         """
         Represents a value to assign to a placeholder in a template.
 
+        - Hand-written (not a dataclass) because one instance is created per
+          body variable per send; a plain __slots__ class skips the generated
+          dataclass machinery on that hot path.
+
         Example:
             >>> from pywa.types import Template
             >>> Template.TextValue(var='John Doe')  # The template was created with 'Hello, {John}!'
@@ -1042,16 +1091,29 @@ class Template:
             value: The value to assign to the placeholder.
         """
 
-        type: ParamType = dataclasses.field(
-            default=ParamType.TEXT, init=False, repr=False
-        )
-        value: str
+        __slots__ = ("value",)
+
+        type: ClassVar[str] = _PT_TEXT
+
+        def __init__(self, value: str):
+            self.value = value
+
+        def __repr__(self) -> str:
+            return f"Template.TextValue(value={self.value!r})"
+
+        def __eq__(self, other) -> bool:
+            if other.__class__ is not Template.TextValue:
+                return NotImplemented
+            return self.value == other.value
+
+        def __hash__(self) -> int:
+            return hash((self.value,))
 
         def to_dict(self, is_url: None = None) -> dict[str, str]:
-            return dict(type=self.type.value, text=self.value)
+            return {"type": _PT_TEXT, "text": self.value}
 
-    @dataclasses.dataclass(slots=True)
-    class Currency(ComponentABC):
+    @dataclasses.dataclass(slots=True, frozen=True)
+    class Currency:
         """
         Represents a currency variable.
 
@@ -1061,25 +1123,29 @@ class Template:
             amount_1000: Amount multiplied by 1000.
         """
 
-        type: ParamType = dataclasses.field(
-            default=ParamType.CURRENCY, init=False, repr=False
-        )
+        type: ClassVar[str] = _PT_CURRENCY
         fallback_value: str
         code: str
         amount_1000: int
+        _dict: dict | None = dataclasses.field(
+            default=None, init=False, repr=False, compare=False
+        )
 
         def to_dict(self) -> dict[str, str]:
-            return dict(
-                type=self.type.value,
-                currency=dict(
-                    fallback_value=self.fallback_value,
-                    code=self.code,
-                    amount_1000=self.amount_1000,
-                ),
-            )
-
-    @dataclasses.dataclass(slots=True)
-    class DateTime(ComponentABC):
+            if (d := self._dict) is None:
+                d = {
+                    "type": _PT_CURRENCY,
+                    "currency": {
+                        "fallback_value": self.fallback_value,
+                        "code": self.code,
+                        "amount_1000": self.amount_1000,
+                    },
+                }
+                object.__setattr__(self, "_dict", d)
+            return d
+
+    @dataclasses.dataclass(slots=True, frozen=True)
+    class DateTime:
         """
         Represents a date time variable.
 
@@ -1087,21 +1153,23 @@ class Template:
             fallback_value: Default text if localization fails.
         """
 
-        type: ParamType = dataclasses.field(
-            default=ParamType.DATE_TIME, init=False, repr=False
-        )
+        type: ClassVar[str] = _PT_DATE_TIME
         fallback_value: str
+        _dict: dict | None = dataclasses.field(
+            default=None, init=False, repr=False, compare=False
+        )
 
         def to_dict(self) -> dict[str, str]:
-            return dict(
-                type=self.type.value,
-                date_time=dict(
-                    fallback_value=self.fallback_value,
-                ),
-            )
+            if (d := self._dict) is None:
+                d = {
+                    "type": _PT_DATE_TIME,
+                    "date_time": {"fallback_value": self.fallback_value},
+                }
+                object.__setattr__(self, "_dict", d)
+            return d
 
     @dataclasses.dataclass(slots=True)
-    class Document(ComponentABC):
+    class Document:
         """
         Represents a document.
 
@@ -1111,23 +1179,21 @@ class Template:
             filename: The filename of the document (Required if sending bytes or an open file object).
         """
 
-        type: ParamType = dataclasses.field(
-            default=ParamType.DOCUMENT, init=False, repr=False
-        )
+        type: ClassVar[str] = _PT_DOCUMENT
         document: str | pathlib.Path | bytes | BinaryIO
         caption: str | None = None
         filename: str | None = None
 
         def to_dict(self, is_url: bool) -> dict[str, str]:
-            return dict(
-                type=self.type.value,
-                document={"link" if is_url else "id": self.document}
-                | (dict(caption=self.caption) if self.caption else {})
-                | (dict(filename=self.filename) if self.filename else {}),
-            )
+            document = {"link" if is_url else "id": self.document}
+            if self.caption:
+                document["caption"] = self.caption
+            if self.filename:
+                document["filename"] = self.filename
+            return {"type": _PT_DOCUMENT, "document": document}
 
     @dataclasses.dataclass(slots=True)
-    class Image(ComponentABC):
+    class Image:
         """
         Represents an image.
 
@@ -1137,22 +1203,19 @@ class Template:
             mime_type: The mime type of the image (Required if sending bytes or an open file object).
         """
 
-        type: ParamType = dataclasses.field(
-            default=ParamType.IMAGE, init=False, repr=False
-        )
+        type: ClassVar[str] = _PT_IMAGE
         image: str | pathlib.Path | bytes | BinaryIO
         caption: str | None = None
         mime_type: str | None = None
 
         def to_dict(self, is_url: bool) -> dict[str, str]:
-            return dict(
-                type=self.type.value,
-                image={"link" if is_url else "id": self.image}
-                | (dict(caption=self.caption) if self.caption else {}),
-            )
+            image = {"link" if is_url else "id": self.image}
+            if self.caption:
+                image["caption"] = self.caption
+            return {"type": _PT_IMAGE, "image": image}
 
     @dataclasses.dataclass(slots=True)
-    class Video(ComponentABC):
+    class Video:
         """
         Represents a video.
 
@@ -1162,22 +1225,19 @@ class Template:
             mime_type: The mime type of the video (Required if sending bytes or an open file object).
         """
 
-        type: ParamType = dataclasses.field(
-            default=ParamType.VIDEO, init=False, repr=False
-        )
+        type: ClassVar[str] = _PT_VIDEO
         video: str | pathlib.Path | bytes | BinaryIO
         caption: str | None = None
         mime_type: str | None = None
 
         def to_dict(self, is_url: bool) -> dict[str, str]:
-            return dict(
-                type=self.type.value,
-                video={"link" if is_url else "id": self.video}
-                | (dict(caption=self.caption) if self.caption else {}),
-            )
+            video = {"link" if is_url else "id": self.video}
+            if self.caption:
+                video["caption"] = self.caption
+            return {"type": _PT_VIDEO, "video": video}
 
-    @dataclasses.dataclass(slots=True)
-    class Location(ComponentABC):
+    @dataclasses.dataclass(slots=True, frozen=True)
+    class Location:
         """
         Represents a location.
 
@@ -1188,27 +1248,28 @@ class Template:
             address: The address of the location.
         """
 
-        type: ParamType = dataclasses.field(
-            default=ParamType.LOCATION, init=False, repr=False
-        )
+        type: ClassVar[str] = _PT_LOCATION
         latitude: float
         longitude: float
         name: str | None = None
         address: str | None = None
+        _dict: dict | None = dataclasses.field(
+            default=None, init=False, repr=False, compare=False
+        )
 
-        def to_dict(self) -> dict[str, str]:
-            return dict(
-                type=self.type.value,
-                location=dict(
-                    latitude=self.latitude,
-                    longitude=self.longitude,
-                    **(dict(name=self.name) if self.name else {}),
-                    **(dict(address=self.address) if self.address else {}),
-                ),
-            )
-
-    @dataclasses.dataclass(slots=True)
-    class QuickReplyButtonData(ComponentABC):
+        def to_dict(self, is_url: None = None) -> dict[str, str]:
+            if (d := self._dict) is None:
+                location = {"latitude": self.latitude, "longitude": self.longitude}
+                if self.name:
+                    location["name"] = self.name
+                if self.address:
+                    location["address"] = self.address
+                d = {"type": _PT_LOCATION, "location": location}
+                object.__setattr__(self, "_dict", d)
+            return d
+
+    @dataclasses.dataclass(slots=True, frozen=True)
+    class QuickReplyButtonData:
         """
         Represents a quick reply button.
 
@@ -1217,22 +1278,34 @@ class Template:
              (you can listen for this data with @on_callback_button decorator).
         """
 
-        type: ParamType = dataclasses.field(
-            default=ParamType.BUTTON, init=False, repr=False
-        )
-        sub_type: ButtonType = dataclasses.field(
-            default=ButtonType.QUICK_REPLY, init=False, repr=False
-        )
+        type: ClassVar[str] = _PT_BUTTON
+        sub_type: ClassVar[str] = _BT_QUICK_REPLY
         data: CallbackDataT
 
         def to_dict(self) -> dict[str, str]:
-            return dict(
-                type="payload",
-                payload=_resolve_callback_data(self.data),
-            )
+            return {
+                "type": "payload",
+                "payload": _resolve_callback_data(self.data),
+            }
 
-    @dataclasses.dataclass(slots=True)
-    class UrlButtonValue(ComponentABC):
+    @dataclasses.dataclass(slots=True, frozen=True)
+    class _TextButtonParam:
+        """Base for the button parameters that serialize as a plain text value."""
+
+        _value_field: ClassVar[str]
+
+        _dict: dict | None = dataclasses.field(
+            default=None, init=False, repr=False, compare=False
+        )
+
+        def to_dict(self) -> dict[str, str]:
+            if (d := self._dict) is None:
+                d = {"type": "text", "text": getattr(self, self._value_field)}
+                object.__setattr__(self, "_dict", d)
+            return d
+
+    @dataclasses.dataclass(slots=True, frozen=True)
+    class UrlButtonValue(_TextButtonParam):
         """
         Represents a URL button variable.
 
@@ -1244,19 +1317,13 @@ class Template:
             value: The value to assign to the variable in the template (appended to the end of the URL).
         """
 
-        type: ParamType = dataclasses.field(
-            default=ParamType.BUTTON, init=False, repr=False
-        )
-        sub_type: ButtonType = dataclasses.field(
-            default=ButtonType.URL, init=False, repr=False
-        )
+        type: ClassVar[str] = _PT_BUTTON
+        sub_type: ClassVar[str] = _BT_URL
+        _value_field: ClassVar[str] = "value"
         value: str
 
-        def to_dict(self) -> dict[str, str]:
-            return dict(type="text", text=self.value)
-
-    @dataclasses.dataclass(slots=True)
-    class OTPButtonCode(ComponentABC):
+    @dataclasses.dataclass(slots=True, frozen=True)
+    class OTPButtonCode(_TextButtonParam):
         """
         Represents an OTP button variable.
 
@@ -1268,19 +1335,13 @@ class Template:
             code: The code to copy or autofill when the user taps the button.
         """
 
-        type: ParamType = dataclasses.field(
-            default=ParamType.BUTTON, init=False, repr=False
-        )
-        sub_type: ButtonType = dataclasses.field(
-            default=ButtonType.URL, init=False, repr=False
-        )
+        type: ClassVar[str] = _PT_BUTTON
+        sub_type: ClassVar[str] = _BT_URL
+        _value_field: ClassVar[str] = "code"
         code: str
 
-        def to_dict(self) -> dict[str, str]:
-            return dict(type="text", text=self.code)
-
-    @dataclasses.dataclass(slots=True)
-    class MPMButton(ComponentABC):
+    @dataclasses.dataclass(slots=True, frozen=True)
+    class MPMButton:
         """
         Represent a multi-product message (MPM) button
 
@@ -1305,28 +1366,25 @@ class Template:
             product_sections: The product sections to send with the template.
         """
 
-        type: ParamType = dataclasses.field(
-            default=ParamType.BUTTON, init=False, repr=False
-        )
-        sub_type: ButtonType = dataclasses.field(
-            default=ButtonType.MPM, init=False, repr=False
-        )
+        type: ClassVar[str] = _PT_BUTTON
+        sub_type: ClassVar[str] = _BT_MPM
         thumbnail_product_sku: str
-        product_sections: Iterable[ProductsSection]
+        product_sections: tuple[ProductsSection, ...]
+
+        def __post_init__(self):
+            object.__setattr__(self, "product_sections", tuple(self.product_sections))
 
         def to_dict(self) -> dict[str, str]:
-            return dict(
-                type="action",
-                action=dict(
-                    thumbnail_product_retailer_id=self.thumbnail_product_sku,
-                    sections=tuple(
-                        section.to_dict() for section in self.product_sections
-                    ),
-                ),
-            )
+            return {
+                "type": "action",
+                "action": {
+                    "thumbnail_product_retailer_id": self.thumbnail_product_sku,
+                    "sections": _serialize(self.product_sections),
+                },
+            }
 
-    @dataclasses.dataclass(slots=True)
-    class CatalogButton(ComponentABC):
+    @dataclasses.dataclass(slots=True, frozen=True)
+    class CatalogButton:
         """
         Represent a catalog button
 
@@ -1339,24 +1397,20 @@ class Template:
                 provided, the product image of the first item in your catalog will be used.
         """
 
-        type: ParamType = dataclasses.field(
-            default=ParamType.BUTTON, init=False, repr=False
-        )
-        sub_type: ButtonType = dataclasses.field(
-            default=ButtonType.CATALOG, init=False, repr=False
-        )
+        type: ClassVar[str] = _PT_BUTTON
+        sub_type: ClassVar[str] = _BT_CATALOG
         thumbnail_product_sku: str | None = None
 
         def to_dict(self) -> dict[str, str]:
-            return dict(
-                type="action",
-                action=dict(
-                    thumbnail_product_retailer_id=self.thumbnail_product_sku,
-                ),
-            )
+            return {
+                "type": "action",
+                "action": {
+                    "thumbnail_product_retailer_id": self.thumbnail_product_sku,
+                },
+            }
 
-    @dataclasses.dataclass(slots=True)
-    class CopyCodeButton(ComponentABC):
+    @dataclasses.dataclass(slots=True, frozen=True)
+    class CopyCodeButton:
         """
         Represents a copy code button variable (copies the code to the user's clipboard).
 
@@ -1368,19 +1422,21 @@ class Template:
             code: The code to copy when the user taps the button.
         """
 
-        type: ParamType = dataclasses.field(
-            default=ParamType.BUTTON, init=False, repr=False
-        )
-        sub_type: ButtonType = dataclasses.field(
-            default=ButtonType.COPY_CODE, init=False, repr=False
-        )
+        type: ClassVar[str] = _PT_BUTTON
+        sub_type: ClassVar[str] = _BT_COPY_CODE
         code: str
+        _dict: dict | None = dataclasses.field(
+            default=None, init=False, repr=False, compare=False
+        )
 
         def to_dict(self) -> dict[str, str]:
-            return dict(type="coupon_code", coupon_code=self.code)
+            if (d := self._dict) is None:
+                d = {"type": "coupon_code", "coupon_code": self.code}
+                object.__setattr__(self, "_dict", d)
+            return d
 
-    @dataclasses.dataclass(slots=True)
-    class FlowButton(ComponentABC):
+    @dataclasses.dataclass(slots=True, frozen=True)
+    class FlowButton:
         """
         Represents a flow button.
 
@@ -1396,27 +1452,18 @@ class Template:
             flow_action_data: The data to pass to the screen that specifies when creating the template.
         """
 
-        type: ParamType = dataclasses.field(
-            default=ParamType.BUTTON, init=False, repr=False
-        )
-        sub_type: ButtonType = dataclasses.field(
-            default=ButtonType.FLOW, init=False, repr=False
-        )
+        type: ClassVar[str] = _PT_BUTTON
+        sub_type: ClassVar[str] = _BT_FLOW
         flow_token: str | None = None
         flow_action_data: dict[str, Any] | None = None
 
         def to_dict(self) -> dict[str, str]:
-            return dict(
-                type="action",
-                action=dict(
-                    **({"flow_token": self.flow_token} if self.flow_token else {}),
-                    **(
-                        {"flow_action_data": self.flow_action_data}
-                        if self.flow_action_data
-                        else {}
-                    ),
-                ),
-            )
+            action = {}
+            if self.flow_token:
+                action["flow_token"] = self.flow_token
+            if self.flow_action_data:
+                action["flow_action_data"] = self.flow_action_data
+            return {"type": "action", "action": action}
 
 
 @dataclasses.dataclass(slots=True, frozen=True, kw_only=True)